@@ -14,15 +14,20 @@ import platform
 import socket
 import json
 import subprocess
+import heapq
+import operator
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from collections import deque
+from itertools import islice
 import threading
 import signal
 from pathlib import Path
 
 import psutil
 from rich.console import Console
-from rich.table import Table
+from rich.table import Table, Column
 from rich.layout import Layout
 from rich.panel import Panel
 from rich.progress import Progress, BarColumn, TextColumn, MofNCompleteColumn
@@ -34,18 +39,147 @@ from rich.align import Align
 from rich.status import Status
 from rich.tree import Tree
 
-try:
-    import GPUtil
-    GPU_AVAILABLE = True
-except ImportError:
-    GPU_AVAILABLE = False
-
 try:
     import docker
     DOCKER_AVAILABLE = True
 except ImportError:
     DOCKER_AVAILABLE = False
 
+try:
+    from pystemd.systemd1 import Manager as SystemdManager
+    PYSTEMD_AVAILABLE = True
+except ImportError:
+    PYSTEMD_AVAILABLE = False
+
+# Address family of the IPv4 addresses listed per interface
+_AF_INET = socket.AF_INET
+
+# Byte units, one per power of 1024
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Sparkline levels, lowest to highest
+_SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+
+# Progress bar strings for the widths the panels use, indexed by filled cells
+_BARS = {
+    width: tuple("█" * filled + "░" * (width - filled) for filled in range(width + 1))
+    for width in (10, 15, 20)
+}
+
+# Status colors and temperature icons, indexed by how many thresholds a value exceeds
+_COLORS = ("green", "yellow", "red")
+_TEMP_ICONS = ("🟢", "🟡", "🔴")
+_PROCESS_STYLES = ("white", "yellow", "red")
+
+# Table options and (header, column options) pairs for each panel's table
+_COMPACT_TABLE = {'show_header': False, 'box': None, 'padding': (0, 1)}
+_BOXED_TABLE = {'show_header': True, 'box': box.ROUNDED}
+_METRIC_COLUMNS = (("Metric", {'style': "cyan"}), ("Value", {}), ("Visual", {}))
+_TABLE_LAYOUTS = {
+    'system_info': (_COMPACT_TABLE, (("Label", {'style': "cyan"}), ("Value", {}))),
+    'cpu': (_COMPACT_TABLE, _METRIC_COLUMNS),
+    'memory': (_COMPACT_TABLE, (("Type", {'style': "cyan"}), ("Usage", {}), ("Visual", {}))),
+    'disk': (_BOXED_TABLE, (
+        ("Device", {'style': "cyan"}), ("Mount Point", {}), ("File System", {}),
+        ("Used", {}), ("Total", {}), ("Usage", {})
+    )),
+    'network': (_COMPACT_TABLE, _METRIC_COLUMNS),
+    'gpu': (_BOXED_TABLE, (("GPU", {'style': "cyan"}), ("Load", {}), ("Memory", {}), ("Temperature", {}))),
+    'battery': (_COMPACT_TABLE, _METRIC_COLUMNS),
+    'processes': (_BOXED_TABLE, (
+        ("PID", {'justify': "right", 'style': "dim"}), ("Name", {'style': "cyan"}),
+        ("CPU%", {'justify': "right"}), ("Mem%", {'justify': "right"}), ("Memory", {'justify': "right"})
+    )),
+    'docker': (_BOXED_TABLE, (("Container", {'style': "cyan"}), ("Image", {}), ("Status", {}), ("Ports", {}))),
+    'services': (_BOXED_TABLE, (("Service", {'style': "cyan"}), ("Status", {}), ("Description", {}))),
+    'alerts': (_BOXED_TABLE, (("Time", {'style': "dim"}), ("Level", {}), ("Message", {'style': "cyan"}))),
+}
+
+# Each panel's columns, built once; tables get empty copies of them
+_TABLE_COLUMNS = {
+    name: tuple(Column(header=header, **column_options) for header, column_options in columns)
+    for name, (_, columns) in _TABLE_LAYOUTS.items()
+}
+
+# Fields of the process rows gathered while scanning, in tuple order
+_PROCESS_FIELDS = ('pid', 'name', 'cpu_percent', 'memory_percent', 'rss')
+
+# Alerts younger than this count as recent in the system info panel
+_RECENT_ALERT_AGE = timedelta(minutes=5)
+
+# Help text, filled in with the current configuration
+_HELP_TEXT = """
+[bold cyan]Keyboard Shortcuts:[/bold cyan]
+
+[yellow]q[/yellow] - Quit application
+[yellow]h[/yellow] - Toggle this help
+[yellow]1[/yellow] - Main dashboard view
+[yellow]2[/yellow] - Docker containers view  
+[yellow]3[/yellow] - System alerts view
+
+[yellow]c[/yellow] - Sort processes by CPU
+[yellow]m[/yellow] - Sort processes by Memory
+[yellow]p[/yellow] - Sort processes by PID
+[yellow]n[/yellow] - Sort processes by Name
+
+[yellow]s[/yellow] - Toggle system info panel
+[yellow]u[/yellow] - Toggle CPU panel
+[yellow]r[/yellow] - Toggle memory panel
+[yellow]d[/yellow] - Toggle disk panel
+[yellow]t[/yellow] - Toggle network panel
+[yellow]g[/yellow] - Toggle GPU panel
+[yellow]b[/yellow] - Toggle battery panel
+
+[yellow]+[/yellow] - Increase update interval
+[yellow]-[/yellow] - Decrease update interval
+
+[bold green]Current Configuration:[/bold green]
+Update Interval: {interval:.1f}s
+Process Sort: {sort_key}
+        """
+
+# The formatters, progress bars and styled cells are memoized because the
+# same values (process RSS, disk sizes, totals, percentages, statuses)
+# recur from one refresh to the next
+
+@functools.lru_cache(maxsize=4096)
+def format_bytes(bytes_value):
+    """Format bytes to human readable format"""
+    if bytes_value == 0:
+        return "0 B"
+    
+    # bit_length() is floor(log2) + 1, and each unit spans 10 bits
+    bits = int(bytes_value).bit_length()
+    unit_index = min(max(bits - 1, 0) // 10, len(_UNITS) - 1)
+    
+    return f"{bytes_value / (1 << (unit_index * 10)):.1f} {_UNITS[unit_index]}"
+
+@functools.lru_cache(maxsize=256)
+def format_frequency(freq_mhz):
+    """Format frequency from MHz to human readable"""
+    if freq_mhz >= 1000:
+        return f"{freq_mhz/1000:.1f} GHz"
+    return f"{freq_mhz:.0f} MHz"
+
+@functools.lru_cache(maxsize=1024)
+def progress_bar(percentage, width=20):
+    """Create a visual progress bar"""
+    filled = min(max(int(width * percentage / 100), 0), width)
+    if width in _BARS:
+        bar = _BARS[width][filled]
+    else:
+        bar = "█" * filled + "░" * (width - filled)
+    
+    # Color coding
+    color = _COLORS[(percentage > 70) + (percentage > 90)]
+    
+    return Text(f"{bar} {percentage:5.1f}%", style=color)
+
+@functools.lru_cache(maxsize=512)
+def styled_text(text, style=""):
+    """Create a Text cell, shared between rows and refreshes showing the same value"""
+    return Text(text, style=style)
+
 class SystemMonitor:
     def __init__(self):
         self.console = Console()
@@ -59,6 +193,8 @@ class SystemMonitor:
         # UI State
         self.current_view = "main"  # main, processes, docker, network, logs
         self.process_sort_key = self.config.get('process_sort_key', 'cpu_percent')
+        if self.process_sort_key not in ('cpu_percent', 'memory_percent', 'pid', 'name'):
+            self.process_sort_key = 'cpu_percent'
         self.show_processes = True
         self.selected_process_index = 0
         self.show_help = False
@@ -78,15 +214,51 @@ class SystemMonitor:
         self.network_history = deque(maxlen=100)
         self.disk_io_history = deque(maxlen=100)
         
-        # Previous counters for delta calculations
-        self.prev_net_counters = self._get_net_counters()
-        self.prev_disk_counters = self._get_disk_io_counters()
+        # Previous counters and sample times for delta calculations; the
+        # first sample only records a baseline
+        self.prev_net_counters = None
+        self.prev_disk_counters = None
+        self._prev_net_ts = 0.0
+        self._prev_disk_ts = 0.0
+        
+        # Slow-changing data (disks, interfaces) is cached as
+        # key -> (value, expires_at); see _cached
+        self._cache = {}
         
-        # System info cache
+        # System info cache; every row but uptime is fixed, so those are
+        # built once, split around where the uptime row goes
         self.system_info = self._get_system_info()
+        info = self.system_info
+        self._static_sysinfo_rows = (
+            (Text("Hostname"), Text(info['node'])),
+            (Text("OS"), Text(f"{info['system']} {info['release']}")),
+            (Text("Architecture"), Text(info['machine'])),
+            (Text("Processor"), Text(info['processor'])),
+            (Text("Python"), Text(info['python_version'])),
+        )
+        self._boot_time_row = (Text("Boot Time"), Text(info['boot_time'].strftime("%Y-%m-%d %H:%M:%S")))
+        self._cpu_count_logical = psutil.cpu_count(logical=True)
+        self._cpu_count_physical = psutil.cpu_count(logical=False)
+        
+        # virtual_memory() fields are fixed per platform
+        virtual = psutil.virtual_memory()
+        self._has_buffers = hasattr(virtual, 'buffers')
+        self._has_cached = hasattr(virtual, 'cached')
+        
+        # Process objects are kept between samples, with their creation
+        # time, so cpu_percent() has a previous reading to measure against
+        self._process_cache = {}
+        
+        # GPUs are detected once at startup; see _detect_gpus
+        self._nvml = None
+        self._gpu_handles = []
+        self._gpu_names = []
+        self._gputil = None
+        self._detect_gpus()
         
         # Alerts and thresholds
-        self.alerts = []
+        self.alerts = deque(maxlen=10)  # Keeps only the last 10 alerts
+        self._alerted_cpu = None
         self.thresholds = self.config.get('thresholds', {
             'cpu_warning': 80,
             'cpu_critical': 95,
@@ -100,18 +272,75 @@ class SystemMonitor:
         
         # Docker monitoring
         self.docker_client = None
+        self._docker_pool = None
         if DOCKER_AVAILABLE:
             try:
                 self.docker_client = docker.from_env()
+                # Container stats are one HTTP round trip each, so they are
+                # fetched in parallel
+                self._docker_pool = ThreadPoolExecutor(max_workers=8)
             except:
                 pass
+        
+        # Services are listed over D-Bus when pystemd is installed, falling
+        # back to running systemctl otherwise
+        self._systemd = None
+        if PYSTEMD_AVAILABLE:
+            try:
+                self._systemd = SystemdManager()
+                self._systemd.load()
+            except:
+                self._systemd = None
+        # A D-Bus listing is cheap enough to refresh every few ticks; forking
+        # systemctl is kept to every 30 seconds
+        self._services_interval = 5 * self.update_interval if self._systemd is not None else 30.0
+        
+        # Metrics are sampled by one background thread per collector group,
+        # each on its own cadence (None follows update_interval) and only
+        # while a panel showing it is enabled; panels only read the latest
+        # snapshot, which is swapped in under a lock
+        self._snapshot_lock = threading.Lock()
+        self._collectors = (
+            (None, self._collect_snapshot, None, None),
+            ('processes', lambda: self._get_top_processes(limit=15), None, lambda: self.current_view == "main"),
+            ('connections', self._get_network_connections, None, lambda: self.current_view == "main" and self.show_network),
+            ('docker', self._get_docker_info, 2.0, lambda: self.current_view == "docker"),
+            ('services', self._get_system_services, self._services_interval, lambda: self.current_view == "docker"),
+        )
+        self._snapshot = {'processes': [], 'connections': None, 'docker': None, 'services': []}
+        for key, collect, interval, enabled in self._collectors:
+            if interval is None and (enabled is None or enabled()):
+                self._publish(key, collect())
+        self._samplers = [
+            threading.Thread(target=self._collector_loop, args=collector, daemon=True)
+            for collector in self._collectors
+        ]
+        
+        # The layout tree is built once and its regions are updated in place
+        self.layout = self._build_layout()
+        self.regions = {
+            name: self.layout[name]
+            for name in (
+                "header", "main", "docker", "alerts",
+                "left", "system_cpu", "memory_disk", "network_battery",
+                "system_panel", "cpu_panel", "memory_panel", "disk_panel",
+                "network_panel", "battery_panel", "gpu_panel",
+                "alerts_panel", "processes_panel",
+                "docker_panel", "services_panel",
+                "alerts_view_panel", "alerts_system_panel"
+            )
+        }
+        self._region_args = {}
+        # Panels whose inputs change slowly are kept as name -> (signature, panel)
+        self._panel_cache = {}
     
     def _load_config(self):
         """Load configuration from file"""
+        # Opened directly rather than checked with exists() first; a missing
+        # or unreadable file falls through to the defaults either way
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
+            with open(self.config_file, 'r') as f:
+                return json.load(f)
         except:
             pass
         return self._default_config()
@@ -164,6 +393,7 @@ class SystemMonitor:
     def _get_system_info(self):
         """Get static system information"""
         uname = platform.uname()
+        boot_epoch = psutil.boot_time()
         return {
             'system': uname.system,
             'node': uname.node,
@@ -172,7 +402,8 @@ class SystemMonitor:
             'machine': uname.machine,
             'processor': uname.processor or 'Unknown',
             'python_version': platform.python_version(),
-            'boot_time': datetime.fromtimestamp(psutil.boot_time())
+            'boot_epoch': boot_epoch,
+            'boot_time': datetime.fromtimestamp(boot_epoch)
         }
     
     def _get_net_counters(self):
@@ -191,37 +422,20 @@ class SystemMonitor:
         except:
             return 0, 0
     
-    def _format_bytes(self, bytes_value):
-        """Format bytes to human readable format"""
-        if bytes_value == 0:
-            return "0 B"
-        
-        units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
-        unit_index = 0
-        
-        while bytes_value >= 1024 and unit_index < len(units) - 1:
-            bytes_value /= 1024
-            unit_index += 1
-            
-        return f"{bytes_value:.1f} {units[unit_index]}"
-    
-    def _format_frequency(self, freq_mhz):
-        """Format frequency from MHz to human readable"""
-        if freq_mhz >= 1000:
-            return f"{freq_mhz/1000:.1f} GHz"
-        return f"{freq_mhz:.0f} MHz"
+    _format_bytes = staticmethod(format_bytes)
+    _format_frequency = staticmethod(format_frequency)
     
     def _get_cpu_info(self):
         """Get comprehensive CPU information"""
         cpu_info = {}
         
-        # Basic CPU stats
-        cpu_info['usage'] = psutil.cpu_percent(interval=None)
-        cpu_info['count_logical'] = psutil.cpu_count(logical=True)
-        cpu_info['count_physical'] = psutil.cpu_count(logical=False)
-        
-        # Per-core usage
-        cpu_info['per_core'] = psutil.cpu_percent(interval=None, percpu=True)
+        # Per-core usage; the aggregate is derived from it so /proc/stat
+        # is only read once per refresh
+        per_core = psutil.cpu_percent(interval=None, percpu=True)
+        cpu_info['per_core'] = per_core
+        cpu_info['usage'] = sum(per_core) / len(per_core) if per_core else 0.0
+        cpu_info['count_logical'] = self._cpu_count_logical
+        cpu_info['count_physical'] = self._cpu_count_physical
         
         # CPU frequency
         try:
@@ -235,7 +449,7 @@ class SystemMonitor:
             
         # CPU temperature (if available)
         try:
-            temps = psutil.sensors_temperatures()
+            temps = self._read_sensor('temperatures', psutil.sensors_temperatures) or {}
             if 'coretemp' in temps:
                 cpu_info['temperature'] = temps['coretemp'][0].current
             elif 'cpu_thermal' in temps:
@@ -265,12 +479,45 @@ class SystemMonitor:
             'swap_total_gb': swap.total / (1024**3),
         }
     
+    def _cached(self, key, ttl, compute):
+        """Return a cached value, recomputing it once it is ttl seconds old"""
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry and now < entry[1]:
+            return entry[0]
+        
+        value = compute()
+        self._cache[key] = (value, now + ttl)
+        return value
+    
+    def _read_sensor(self, key, read):
+        """Read a sensor, skipping it for 60 seconds after it returns no data"""
+        # VMs and servers usually lack these sensors entirely, so an empty
+        # read spares the sysfs walk until hardware could have been plugged in
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry and now < entry[1]:
+            return None
+        
+        try:
+            value = read()
+        except:
+            value = None
+        if not value:
+            self._cache[key] = (None, now + 60.0)
+        return value
+    
     def _get_disk_info(self):
+        """Get disk usage information, refreshed every 10 seconds"""
+        # Usage changes slowly and statvfs can block on network mounts
+        return self._cached('disk_info', 10.0, self._read_disk_info)
+    
+    def _read_disk_info(self):
         """Get disk usage information for all mounted disks"""
         disks = []
-        partitions = psutil.disk_partitions()
         
-        for partition in partitions:
+        # Re-read the partition table every 30 seconds to pick up new mounts
+        for partition in self._cached('partitions', 30.0, psutil.disk_partitions):
             try:
                 usage = psutil.disk_usage(partition.mountpoint)
                 disks.append({
@@ -284,20 +531,43 @@ class SystemMonitor:
                 })
             except PermissionError:
                 continue
-                
+        
         return disks
     
     def _get_network_info(self):
         """Get network information and calculate speeds"""
         current_counters = self._get_net_counters()
+        now = time.monotonic()
         
-        # Calculate speeds
-        upload_speed = (current_counters[0] - self.prev_net_counters[0]) / self.update_interval
-        download_speed = (current_counters[1] - self.prev_net_counters[1]) / self.update_interval
+        # Calculate speeds over the real time since the previous sample,
+        # which drifts from update_interval when sampling itself is slow
+        upload_speed = download_speed = 0.0
+        if self.prev_net_counters is not None:
+            elapsed = now - self._prev_net_ts
+            upload_speed = (current_counters[0] - self.prev_net_counters[0]) / elapsed
+            download_speed = (current_counters[1] - self.prev_net_counters[1]) / elapsed
         
         self.prev_net_counters = current_counters
+        self._prev_net_ts = now
+        interfaces, interfaces_up = self._get_interfaces()
         
-        # Get network interfaces
+        return {
+            'upload_speed': upload_speed,
+            'download_speed': download_speed,
+            'total_sent': current_counters[0],
+            'total_recv': current_counters[1],
+            'interfaces': interfaces,
+            'interfaces_up': interfaces_up
+        }
+    
+    def _get_interfaces(self):
+        """Get network interfaces, refreshed every 5 seconds"""
+        # Addresses and link state rarely change; only the byte counters
+        # need reading every tick
+        return self._cached('interfaces', 5.0, self._read_interfaces)
+    
+    def _read_interfaces(self):
+        """Get addresses and link state for all network interfaces, and how many are up"""
         interfaces = []
         net_if_addrs = psutil.net_if_addrs()
         net_if_stats = psutil.net_if_stats()
@@ -305,7 +575,7 @@ class SystemMonitor:
         for interface_name, addresses in net_if_addrs.items():
             if interface_name in net_if_stats:
                 stats = net_if_stats[interface_name]
-                ip_addresses = [addr.address for addr in addresses if addr.family == socket.AF_INET]
+                ip_addresses = tuple(addr.address for addr in addresses if addr.family == _AF_INET)
                 
                 interfaces.append({
                     'name': interface_name,
@@ -315,21 +585,44 @@ class SystemMonitor:
                     'ip_addresses': ip_addresses
                 })
         
-        return {
-            'upload_speed': upload_speed,
-            'download_speed': download_speed,
-            'total_sent': current_counters[0],
-            'total_recv': current_counters[1],
-            'interfaces': interfaces
-        }
+        # Counted here so the panel does not rescan the list every refresh
+        return interfaces, sum(1 for iface in interfaces if iface['is_up'])
+    
+    def _detect_gpus(self):
+        """Find a GPU backend, preferring NVML over GPUtil"""
+        # NVML is queried in-process, while GPUtil runs nvidia-smi on every
+        # call. Both are imported lazily so hosts without an NVIDIA card do
+        # not pay for loading them.
+        try:
+            import pynvml
+            pynvml.nvmlInit()
+            for index in range(pynvml.nvmlDeviceGetCount()):
+                handle = pynvml.nvmlDeviceGetHandleByIndex(index)
+                name = pynvml.nvmlDeviceGetName(handle)
+                self._gpu_handles.append(handle)
+                self._gpu_names.append(name.decode() if isinstance(name, bytes) else name)
+            if self._gpu_handles:
+                self._nvml = pynvml
+                return
+        except:
+            pass
+        
+        try:
+            import GPUtil
+            if GPUtil.getGPUs():
+                self._gputil = GPUtil
+        except:
+            pass
     
     def _get_gpu_info(self):
         """Get GPU information if available"""
-        if not GPU_AVAILABLE:
+        if self._nvml:
+            return self._get_nvml_gpu_info()
+        if not self._gputil:
             return None
             
         try:
-            gpus = GPUtil.getGPUs()
+            gpus = self._gputil.getGPUs()
             gpu_info = []
             
             for gpu in gpus:
@@ -346,79 +639,214 @@ class SystemMonitor:
         except:
             return None
     
-    def _get_battery_info(self):
-        """Get battery information"""
+    def _get_nvml_gpu_info(self):
+        """Get GPU information through NVML"""
+        nvml = self._nvml
+        gpu_info = []
+        
+        # Queries are made one by one, since datacenter and MIG devices
+        # reject some of them (NVMLError_NotSupported); those fields are
+        # left as None and shown as N/A
+        for handle, name in zip(self._gpu_handles, self._gpu_names):
+            utilization = self._nvml_query(nvml.nvmlDeviceGetUtilizationRates, handle)
+            memory = self._nvml_query(nvml.nvmlDeviceGetMemoryInfo, handle)
+            gpu_info.append({
+                'name': name,
+                'load': utilization.gpu if utilization else None,
+                'memory_used': memory.used // (1024 * 1024) if memory else None,
+                'memory_total': memory.total // (1024 * 1024) if memory else None,
+                'memory_percent': (memory.used / memory.total) * 100 if memory and memory.total else None,
+                'temperature': self._nvml_query(nvml.nvmlDeviceGetTemperature, handle, nvml.NVML_TEMPERATURE_GPU)
+            })
+            
+        return gpu_info
+    
+    def _nvml_query(self, query, handle, *args):
+        """Run one NVML device query, or return None if it fails"""
         try:
-            battery = psutil.sensors_battery()
-            if battery:
-                return {
-                    'percent': battery.percent,
-                    'plugged': battery.power_plugged,
-                    'time_left': battery.secsleft if battery.secsleft != psutil.POWER_TIME_UNLIMITED else None
-                }
+            return query(handle, *args)
         except:
-            pass
+            return None
+    
+    def _get_battery_info(self):
+        """Get battery information"""
+        battery = self._read_sensor('battery', psutil.sensors_battery)
+        if battery:
+            return {
+                'percent': battery.percent,
+                'plugged': battery.power_plugged,
+                'time_left': battery.secsleft if battery.secsleft != psutil.POWER_TIME_UNLIMITED else None
+            }
         return None
     
     def _get_top_processes(self, limit=10):
         """Get top processes by CPU or memory usage"""
         processes = []
+        cache = self._process_cache
+        pids = psutil.pids()
+        
+        # Forget processes that have exited since the previous sample
+        for pid in cache.keys() - set(pids):
+            del cache[pid]
         
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'memory_info']):
+        for pid in pids:
             try:
-                processes.append(proc.info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                # A pid can be reused by a new process, whose cpu_percent()
+                # must not be measured against the old one's CPU times.
+                # create_time() is memoized per Process object, so the
+                # current value comes from a fresh one
+                current = psutil.Process(pid)
+                created = current.create_time()
+                entry = cache.get(pid)
+                if entry is None or entry[1] != created:
+                    entry = cache[pid] = (current, created)
+                proc = entry[0]
+                
+                # oneshot() reads /proc/<pid>/stat and statm once for all fields
+                with proc.oneshot():
+                    memory_info = proc.memory_info()
+                    
+                    # Linux kernel threads have no address space and never
+                    # use enough CPU to make the table
+                    if psutil.LINUX and memory_info.vms == 0:
+                        continue
+                    
+                    processes.append((
+                        pid,
+                        proc.name(),
+                        proc.cpu_percent(),
+                        proc.memory_percent(),
+                        memory_info.rss
+                    ))
+            except (psutil.ZombieProcess, psutil.AccessDenied):
                 pass
-        
-        # Sort by the selected key
-        processes.sort(key=lambda x: x.get(self.process_sort_key, 0), reverse=True)
-        return processes[:limit]
+            except psutil.NoSuchProcess:
+                cache.pop(pid, None)
+        
+        # Only the top entries are shown, so a bounded heap beats a full sort.
+        # Every field is read directly above (errors raise rather than yield
+        # None), so a C-level itemgetter can serve as the key. Rows are plain
+        # tuples while scanning; only the shown ones become dicts.
+        key = operator.itemgetter(_PROCESS_FIELDS.index(self.process_sort_key))
+        return [dict(zip(_PROCESS_FIELDS, row)) for row in heapq.nlargest(limit, processes, key=key)]
+    
+    def _cached_panel(self, name, signature):
+        """Return the panel last built for name if its inputs are unchanged"""
+        entry = self._panel_cache.get(name)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        return None
+    
+    def _cache_panel(self, name, signature, panel):
+        """Remember the panel built for name from the given inputs"""
+        self._panel_cache[name] = (signature, panel)
+        return panel
+    
+    def _new_table(self, name):
+        """Create an empty table with copies of a panel's prebuilt columns"""
+        table_options = _TABLE_LAYOUTS[name][0]
+        return Table(*(column.copy() for column in _TABLE_COLUMNS[name]), **table_options)
     
     def _create_progress_bar(self, percentage, width=20):
         """Create a visual progress bar"""
-        filled = int(width * percentage / 100)
-        bar = "█" * filled + "░" * (width - filled)
-        
-        # Color coding
-        if percentage > 90:
-            color = "red"
-        elif percentage > 70:
-            color = "yellow"
-        else:
-            color = "green"
-            
-        return Text(f"{bar} {percentage:5.1f}%", style=color)
+        # Rounded to the one decimal shown, so readings that display the
+        # same share one cached Text
+        return progress_bar(round(percentage, 1), width)
     
     def _create_sparkline(self, data, width=20):
         """Create a simple sparkline from data"""
+        # Returned as Text so Rich does not parse the cell for markup
         if not data or len(data) < 2:
-            return "No data"
+            return Text("No data")
             
         # Normalize data to 0-7 range for Unicode block characters
         min_val = min(data)
         max_val = max(data)
         
         if max_val == min_val:
-            return "▄" * width
-            
-        blocks = "▁▂▃▄▅▆▇█"
-        normalized = [(val - min_val) / (max_val - min_val) * 7 for val in data[-width:]]
+            return Text("▄" * width)
         
-        sparkline = ""
-        for val in normalized:
-            sparkline += blocks[int(val)]
-            
-        return sparkline
+        # Build the string in a single join instead of += per block
+        span = max_val - min_val
+        return Text("".join([_SPARK_BLOCKS[int((val - min_val) / span * 7)] for val in data[-width:]]))
+    
+    def _get_disk_io_speed(self):
+        """Calculate disk read/write speeds since the previous sample"""
+        current_io = self._get_disk_io_counters()
+        now = time.monotonic()
+        speeds = None
+        if current_io != (0, 0) and self.prev_disk_counters not in (None, (0, 0)):
+            # One pass over the counter pairs, so per-device counters could
+            # be added without touching the arithmetic
+            elapsed = now - self._prev_disk_ts
+            speeds = tuple((current - previous) / elapsed for current, previous in zip(current_io, self.prev_disk_counters))
+        
+        self.prev_disk_counters = current_io
+        self._prev_disk_ts = now
+        return speeds
     
-    def _check_alerts(self):
-        """Check system metrics against thresholds and generate alerts"""
-        current_time = datetime.now()
+    def _collect_snapshot(self):
+        """Sample all dashboard metrics in one pass"""
+        cpu_info = self._get_cpu_info()
+        mem_info = self._get_memory_info()
+        net_info = self._get_network_info()
         
-        # CPU alert
-        cpu_usage = psutil.cpu_percent(interval=None)
+        self.cpu_history.append(cpu_info['usage'])
+        self.memory_history.append(mem_info['virtual'].percent)
+        total_speed = net_info['download_speed'] + net_info['upload_speed']
+        self.network_history.append(total_speed / 1024)  # Convert to KB/s
+        
+        return {
+            'cpu': cpu_info,
+            'memory': mem_info,
+            # Sensors behind a disabled panel are not read at all
+            'disks': self._get_disk_info() if self.show_disk else [],
+            'disk_io': self._get_disk_io_speed() if self.show_disk else None,
+            'network': net_info,
+            'gpu': self._get_gpu_info() if self.show_gpu else None,
+            'battery': self._get_battery_info() if self.show_battery else None,
+            'cpu_history': tuple(self.cpu_history),
+            'memory_history': tuple(self.memory_history),
+            'network_history': tuple(self.network_history)
+        }
+    
+    def _publish(self, key, value):
+        """Swap in a new snapshot with one collector's result merged in"""
+        with self._snapshot_lock:
+            snapshot = dict(self._snapshot)
+            if key is None:
+                snapshot.update(value)
+            else:
+                snapshot[key] = value
+            self._snapshot = snapshot
+    
+    def _collector_loop(self, key, collect, interval, enabled):
+        """Run one collector group on its own cadence"""
+        # Collectors that follow update_interval were sampled once at startup
+        if interval is None:
+            time.sleep(self.update_interval)
+        while self.running:
+            # A disabled collector is re-checked every update_interval, so
+            # its panel fills in soon after it is shown again
+            if enabled is not None and not enabled():
+                time.sleep(self.update_interval)
+                continue
+            try:
+                self._publish(key, collect())
+            except:
+                pass
+            time.sleep(interval or self.update_interval)
+    
+    def _check_alerts(self, snapshot, current_time):
+        """Check sampled metrics against thresholds and generate alerts"""
+        time_str = current_time.strftime("%H:%M:%S")
+        
+        # CPU alert, from the same per-core sample that feeds the CPU panel
+        cpu_usage = snapshot['cpu']['usage']
         if cpu_usage > self.thresholds['cpu_critical']:
             self.alerts.append({
                 'time': current_time,
+                'time_str': time_str,
                 'level': 'critical',
                 'message': f'Critical CPU usage: {cpu_usage:.1f}%',
                 'metric': 'cpu'
@@ -426,16 +854,18 @@ class SystemMonitor:
         elif cpu_usage > self.thresholds['cpu_warning']:
             self.alerts.append({
                 'time': current_time,
+                'time_str': time_str,
                 'level': 'warning',
                 'message': f'High CPU usage: {cpu_usage:.1f}%',
                 'metric': 'cpu'
             })
         
         # Memory alert
-        memory = psutil.virtual_memory()
+        memory = snapshot['memory']['virtual']
         if memory.percent > self.thresholds['memory_critical']:
             self.alerts.append({
                 'time': current_time,
+                'time_str': time_str,
                 'level': 'critical',
                 'message': f'Critical memory usage: {memory.percent:.1f}%',
                 'metric': 'memory'
@@ -443,13 +873,15 @@ class SystemMonitor:
         elif memory.percent > self.thresholds['memory_warning']:
             self.alerts.append({
                 'time': current_time,
+                'time_str': time_str,
                 'level': 'warning',
                 'message': f'High memory usage: {memory.percent:.1f}%',
                 'metric': 'memory'
             })
-        
-        # Keep only last 10 alerts
-        self.alerts = self.alerts[-10:]
+    
+    def _has_recent_critical(self):
+        """Whether any of the last three alerts is critical"""
+        return any(a['level'] == 'critical' for a in islice(reversed(self.alerts), 3))
     
     def _get_docker_info(self):
         """Get Docker container information"""
@@ -460,19 +892,14 @@ class SystemMonitor:
             containers = self.docker_client.containers.list(all=True)
             container_info = []
             
-            for container in containers:
-                stats = None
-                if container.status == 'running':
-                    try:
-                        stats = container.stats(stream=False)
-                    except:
-                        pass
-                
+            for container, stats in zip(containers, self._docker_pool.map(self._get_container_stats, containers)):
                 container_info.append({
                     'name': container.name,
                     'image': container.image.tags[0] if container.image.tags else 'unknown',
                     'status': container.status,
                     'ports': container.ports,
+                    # Formatted here, at the docker polling rate, rather than per render
+                    'ports_str': (", ".join([f"{k}:{v}" for k, v in container.ports.items()]) if container.ports else "None")[:20],
                     'stats': stats
                 })
             
@@ -480,8 +907,23 @@ class SystemMonitor:
         except:
             return None
     
+    def _get_container_stats(self, container):
+        """Get a single stats sample for a running container"""
+        if container.status != 'running':
+            return None
+        try:
+            return container.stats(stream=False)
+        except:
+            return None
+    
     def _get_system_services(self):
         """Get system services status"""
+        if self._systemd is not None:
+            try:
+                return self._read_systemd_services()
+            except:
+                pass
+        
         services = []
         try:
             # Get systemd services
@@ -502,6 +944,21 @@ class SystemMonitor:
         
         return services[:20]  # Limit to 20 services
     
+    def _read_systemd_services(self):
+        """Get running services from systemd over D-Bus"""
+        units = self._systemd.Manager.ListUnitsByPatterns([b'running'], [b'*.service'])
+        
+        # Each unit is (name, description, load, active, sub, ...), as bytes;
+        # sorted by name to match systemctl's listing
+        services = []
+        for unit in sorted(units)[:20]:
+            services.append({
+                'name': unit[0].decode(errors='replace').replace('.service', ''),
+                'status': unit[3].decode(errors='replace'),
+                'description': unit[1].decode(errors='replace')
+            })
+        return services
+    
     def _get_network_connections(self):
         """Get active network connections"""
         try:
@@ -524,24 +981,99 @@ class SystemMonitor:
         except:
             return {}
     
-    def create_layout(self):
-        """Create the main layout"""
-        # Check for alerts
-        self._check_alerts()
-        
+    def _build_layout(self):
+        """Build the layout tree once; update_layout() only swaps panels in"""
         layout = Layout()
         
-        # Split into header and body
+        # Split into header and body, with one body child per view
         layout.split(
             Layout(name="header", size=3),
             Layout(name="body")
         )
+        layout["body"].split_column(
+            Layout(name="main"),
+            Layout(name="docker"),
+            Layout(name="alerts")
+        )
+        
+        # Main dashboard view
+        layout["main"].split_row(
+            Layout(name="left", ratio=2),
+            Layout(name="right", ratio=1)
+        )
+        layout["left"].split_column(
+            Layout(name="system_cpu", ratio=1),
+            Layout(name="memory_disk", ratio=1),
+            Layout(name="network_battery", ratio=1)
+        )
+        layout["system_cpu"].split_row(
+            Layout(name="system_panel"),
+            Layout(name="cpu_panel")
+        )
+        layout["memory_disk"].split_row(
+            Layout(name="memory_panel"),
+            Layout(name="disk_panel")
+        )
+        layout["network_battery"].split_row(
+            Layout(name="network_panel"),
+            Layout(name="battery_panel"),
+            Layout(name="gpu_panel")
+        )
+        layout["right"].split_column(
+            Layout(name="alerts_panel", ratio=1),
+            Layout(name="processes_panel", ratio=2)
+        )
+        
+        # Docker view
+        layout["docker"].split_column(
+            Layout(name="docker_panel", ratio=2),
+            Layout(name="services_panel", ratio=1)
+        )
+        
+        # Alerts view
+        layout["alerts"].split_column(
+            Layout(name="alerts_view_panel", ratio=1),
+            Layout(name="alerts_system_panel", ratio=1)
+        )
+        
+        return layout
+    
+    def _update_region(self, name, visible, create_panel, *args):
+        """Show a layout region with a fresh panel, or hide it"""
+        region = self.regions[name]
+        region.visible = visible
+        if not visible:
+            return
+        
+        # Panels built from sampled data only change when the sampler
+        # publishes new objects, so skip rebuilding them from the same ones
+        if args:
+            previous = self._region_args.get(name)
+            if previous is not None and all(map(operator.is_, previous, args)):
+                return
+            self._region_args[name] = args
+        
+        region.update(create_panel(*args))
+    
+    def update_layout(self):
+        """Update the panels of the current view in the prebuilt layout"""
+        # Every panel in this frame reads the same sample and the same clock
+        snapshot = self._snapshot
+        now = datetime.now()
+        
+        # Check for alerts once per core sample; frames also render when
+        # other collectors publish, which would repeat the same alerts
+        if snapshot['cpu'] is not self._alerted_cpu:
+            self._alerted_cpu = snapshot['cpu']
+            self._check_alerts(snapshot, now)
+        
+        regions = self.regions
         
         # Header with title, timestamp, and view indicator
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
         alert_indicator = ""
         if self.alerts:
-            recent_critical = any(a['level'] == 'critical' for a in self.alerts[-3:])
+            recent_critical = self._has_recent_critical()
             alert_indicator = " 🔴 CRITICAL ALERTS" if recent_critical else " ⚠️ ALERTS"
         
         header_text = Text.assemble(
@@ -552,92 +1084,70 @@ class SystemMonitor:
             " | ",
             (f"View: {self.current_view.upper()}", "bold green")
         )
-        layout["header"].update(Panel(Align.center(header_text), border_style="bright_blue"))
+        regions["header"].update(Panel(Align.center(header_text), border_style="bright_blue"))
+        
+        for view in ("main", "docker", "alerts"):
+            regions[view].visible = self.current_view == view
         
         if self.current_view == "main":
             # Main dashboard view
-            layout["body"].split_row(
-                Layout(name="left", ratio=2),
-                Layout(name="right", ratio=1)
+            self._update_region("system_panel", self.show_system_info, self._create_system_info_panel, now)
+            # Each panel gets only the snapshot entries it reads, so it is
+            # rebuilt only when one of those was re-sampled
+            self._update_region(
+                "cpu_panel", self.show_cpu, self._create_cpu_panel,
+                snapshot['cpu'], snapshot['cpu_history']
             )
-            
-            # Split left column into rows
-            layout["left"].split_column(
-                Layout(name="system_cpu", ratio=1),
-                Layout(name="memory_disk", ratio=1),
-                Layout(name="network_battery", ratio=1)
+            self._update_region(
+                "memory_panel", self.show_memory, self._create_memory_panel,
+                snapshot['memory'], snapshot['memory_history']
+            )
+            self._update_region(
+                "disk_panel", self.show_disk, self._create_disk_panel,
+                snapshot['disks'], snapshot['disk_io']
+            )
+            self._update_region(
+                "network_panel", self.show_network, self._create_network_panel,
+                snapshot['network'], snapshot['connections'], snapshot['network_history']
             )
             
-            # Split system_cpu row
-            if self.show_system_info and self.show_cpu:
-                layout["system_cpu"].split_row(
-                    Layout(self._create_system_info_panel()),
-                    Layout(self._create_cpu_panel())
-                )
-            elif self.show_system_info:
-                layout["system_cpu"].update(self._create_system_info_panel())
-            elif self.show_cpu:
-                layout["system_cpu"].update(self._create_cpu_panel())
-            
-            # Split memory_disk row
-            if self.show_memory and self.show_disk:
-                layout["memory_disk"].split_row(
-                    Layout(self._create_memory_panel()),
-                    Layout(self._create_disk_panel())
-                )
-            elif self.show_memory:
-                layout["memory_disk"].update(self._create_memory_panel())
-            elif self.show_disk:
-                layout["memory_disk"].update(self._create_disk_panel())
-            
-            # Split network_battery row
-            network_battery_panels = []
-            if self.show_network:
-                network_battery_panels.append(self._create_network_panel())
-            
-            # Add battery panel if available and enabled
-            if self.show_battery:
-                battery_panel = self._create_battery_panel()
-                if "No battery detected" not in str(battery_panel):
-                    network_battery_panels.append(battery_panel)
+            # Battery and GPU panels are only shown when the hardware is present
+            self._update_region(
+                "battery_panel",
+                self.show_battery and bool(snapshot['battery']),
+                self._create_battery_panel, snapshot['battery']
+            )
+            self._update_region(
+                "gpu_panel",
+                self.show_gpu and bool(snapshot['gpu']),
+                self._create_gpu_panel, snapshot['gpu']
+            )
             
-            # Add GPU panel if available and enabled
-            if self.show_gpu:
-                gpu_panel = self._create_gpu_panel()
-                if "No GPU detected" not in str(gpu_panel):
-                    network_battery_panels.append(gpu_panel)
+            # Up to two panels sit side by side, three are stacked
+            network_battery = regions["network_battery"]
+            direction = "column" if len(network_battery.children) >= 3 else "row"
+            if network_battery.splitter.name != direction:
+                network_battery.splitter = Layout.splitters[direction]()
             
-            if len(network_battery_panels) == 1:
-                layout["network_battery"].update(network_battery_panels[0])
-            elif len(network_battery_panels) == 2:
-                layout["network_battery"].split_row(*network_battery_panels)
-            elif len(network_battery_panels) >= 3:
-                layout["network_battery"].split_column(*network_battery_panels[:3])
+            # Hide rows whose panels are all toggled off
+            for row in ("system_cpu", "memory_disk", "network_battery", "left"):
+                regions[row].visible = bool(regions[row].children)
             
-            # Right column for processes or alerts
-            if self.alerts and len(self.alerts) > 3:
-                layout["right"].split_column(
-                    Layout(self._create_alerts_panel(), ratio=1),
-                    Layout(self._create_processes_panel(), ratio=2)
-                )
-            else:
-                layout["right"].update(self._create_processes_panel())
+            # Right column for processes, with alerts on top when there are several
+            self._update_region("alerts_panel", len(self.alerts) > 3, self._create_alerts_panel)
+            self._update_region("processes_panel", True, self._create_processes_panel, snapshot['processes'])
         
         elif self.current_view == "docker":
             # Docker view
-            layout["body"].split_column(
-                Layout(self._create_docker_panel(), ratio=2),
-                Layout(self._create_services_panel(), ratio=1)
-            )
+            self._update_region("docker_panel", True, self._create_docker_panel, snapshot['docker'])
+            self._update_region("services_panel", True, self._create_services_panel, snapshot['services'])
         
         elif self.current_view == "alerts":
             # Alerts view
-            layout["body"].split_column(
-                Layout(self._create_alerts_panel(), ratio=1),
-                Layout(self._create_system_info_panel(), ratio=1)
-            )
+            self._update_region("alerts_view_panel", True, self._create_alerts_panel)
+            self._update_region("alerts_system_panel", True, self._create_system_info_panel, now)
         
-        return layout
+        return self.layout
     
     def signal_handler(self, signum, frame):
         """Handle interrupt signals gracefully"""
@@ -651,55 +1161,70 @@ class SystemMonitor:
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
         
+        for sampler in self._samplers:
+            sampler.start()
+        
         try:
-            with Live(self.create_layout(), refresh_per_second=1, screen=True) as live:
+            # The layout object never changes, only its regions do, so the
+            # loop updates it in place and refreshes once per tick, skipping
+            # ticks where no collector has published since the last frame
+            shown = (self._snapshot, self.current_view)
+            with Live(self.update_layout(), auto_refresh=False, screen=True) as live:
                 while self.running:
                     time.sleep(self.update_interval)
-                    live.update(self.create_layout())
+                    snapshot, view = self._snapshot, self.current_view
+                    if snapshot is shown[0] and view == shown[1]:
+                        continue
+                    shown = (snapshot, view)
+                    self.update_layout()
+                    live.refresh()
         except KeyboardInterrupt:
             self.signal_handler(None, None)
 
-    def _create_system_info_panel(self):
+    def _format_uptime(self, seconds):
+        """Format whole seconds of uptime like str(timedelta)"""
+        days, rem = divmod(seconds, 86400)
+        hours, rem = divmod(rem, 3600)
+        minutes, secs = divmod(rem, 60)
+        text = f"{hours}:{minutes:02}:{secs:02}"
+        if days:
+            text = f"{days} day{'s' if days != 1 else ''}, {text}"
+        return text
+    
+    def _create_system_info_panel(self, now):
         """Create system information panel"""
-        info = self.system_info
-        uptime = datetime.now() - info['boot_time']
+        uptime_seconds = int(now.timestamp() - self.system_info['boot_epoch'])
         
-        table = Table(show_header=False, box=None, padding=(0, 1))
-        table.add_column("Label", style="cyan")
-        table.add_column("Value")
+        alerts_row = None
+        if self.alerts:
+            recent_alerts = len([a for a in self.alerts if now - a['time'] < _RECENT_ALERT_AGE])
+            alert_color = "red" if self._has_recent_critical() else "yellow"
+            alerts_row = (recent_alerts, alert_color)
+        
+        # The panel only changes when the uptime second or the alert summary does
+        signature = (uptime_seconds, alerts_row)
+        panel = self._cached_panel('system_info', signature)
+        if panel is not None:
+            return panel
         
-        table.add_row("Hostname", info['node'])
-        table.add_row("OS", f"{info['system']} {info['release']}")
-        table.add_row("Architecture", info['machine'])
-        table.add_row("Processor", info['processor'])
-        table.add_row("Python", info['python_version'])
-        table.add_row("Uptime", str(uptime).split('.')[0])
-        table.add_row("Boot Time", info['boot_time'].strftime("%Y-%m-%d %H:%M:%S"))
+        table = self._new_table('system_info')
+        
+        for row in self._static_sysinfo_rows:
+            table.add_row(*row)
+        table.add_row("Uptime", self._format_uptime(uptime_seconds))
+        table.add_row(*self._boot_time_row)
         
         # Add alerts indicator
-        if self.alerts:
-            recent_alerts = len([a for a in self.alerts if (datetime.now() - a['time']).seconds < 300])
-            alert_color = "red" if any(a['level'] == 'critical' for a in self.alerts[-3:]) else "yellow"
-            table.add_row("⚠️ Alerts", f"{recent_alerts} recent", Text("", style=alert_color))
+        if alerts_row:
+            table.add_row("⚠️ Alerts", f"{alerts_row[0]} recent", Text("", style=alerts_row[1]))
         
-        return Panel(table, title="System Information", border_style="blue")
+        return self._cache_panel('system_info', signature, Panel(table, title="System Information", border_style="blue"))
     
-    def _create_cpu_panel(self):
+    def _create_cpu_panel(self, cpu_info, cpu_history):
         """Create CPU information panel with enhanced monitoring"""
-        cpu_info = self._get_cpu_info()
-        
-        table = Table(show_header=False, box=None, padding=(0, 1))
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value")
-        table.add_column("Visual")
-        
-        # Overall CPU usage with alert coloring
-        cpu_color = "green"
-        if cpu_info['usage'] > self.thresholds['cpu_critical']:
-            cpu_color = "red"
-        elif cpu_info['usage'] > self.thresholds['cpu_warning']:
-            cpu_color = "yellow"
+        table = self._new_table('cpu')
         
+        # Overall CPU usage
         table.add_row(
             "CPU Usage",
             f"{cpu_info['usage']:.1f}%",
@@ -741,11 +1266,10 @@ class SystemMonitor:
         # Temperature with enhanced monitoring
         if 'temperature' in cpu_info:
             temp = cpu_info['temperature']
-            temp_icon = "🟢"
-            if temp > self.thresholds['temperature_critical']:
-                temp_icon = "🔴"
-            elif temp > self.thresholds['temperature_warning']:
-                temp_icon = "🟡"
+            temp_icon = _TEMP_ICONS[
+                (temp > self.thresholds['temperature_warning'])
+                + (temp > self.thresholds['temperature_critical'])
+            ]
             
             table.add_row(
                 "Temperature",
@@ -763,33 +1287,22 @@ class SystemMonitor:
             )
         
         # History sparkline
-        self.cpu_history.append(cpu_info['usage'])
         table.add_row(
             "History",
-            self._create_sparkline(list(self.cpu_history), width=30),
+            self._create_sparkline(cpu_history, width=30),
             ""
         )
         
         return Panel(table, title="CPU Information", border_style="red")
     
-    def _create_memory_panel(self):
+    def _create_memory_panel(self, mem_info, memory_history):
         """Create memory information panel"""
-        mem_info = self._get_memory_info()
         virtual = mem_info['virtual']
         swap = mem_info['swap']
         
-        table = Table(show_header=False, box=None, padding=(0, 1))
-        table.add_column("Type", style="cyan")
-        table.add_column("Usage")
-        table.add_column("Visual")
-        
-        # Virtual memory with alert coloring
-        memory_color = "green"
-        if virtual.percent > self.thresholds['memory_critical']:
-            memory_color = "red"
-        elif virtual.percent > self.thresholds['memory_warning']:
-            memory_color = "yellow"
+        table = self._new_table('memory')
         
+        # Virtual memory
         table.add_row(
             "RAM",
             f"{self._format_bytes(virtual.used)} / {self._format_bytes(virtual.total)}",
@@ -806,41 +1319,25 @@ class SystemMonitor:
         
         # Memory breakdown
         table.add_row("Available", self._format_bytes(virtual.available), "")
-        if hasattr(virtual, 'buffers'):
+        if self._has_buffers:
             table.add_row("Buffers", self._format_bytes(virtual.buffers), "")
-        if hasattr(virtual, 'cached'):
+        if self._has_cached:
             table.add_row("Cached", self._format_bytes(virtual.cached), "")
         
         # History
-        self.memory_history.append(virtual.percent)
         table.add_row(
             "History",
-            self._create_sparkline(list(self.memory_history), width=30),
+            self._create_sparkline(memory_history, width=30),
             ""
         )
         
         return Panel(table, title="Memory Information", border_style="green")
     
-    def _create_disk_panel(self):
+    def _create_disk_panel(self, disks, disk_io):
         """Create disk information panel with I/O monitoring"""
-        disks = self._get_disk_info()
-        
-        table = Table(show_header=True, box=box.ROUNDED)
-        table.add_column("Device", style="cyan")
-        table.add_column("Mount Point")
-        table.add_column("File System")
-        table.add_column("Used")
-        table.add_column("Total")
-        table.add_column("Usage")
+        table = self._new_table('disk')
         
         for disk in disks[:5]:  # Show top 5 disks
-            # Color code based on usage
-            usage_color = "green"
-            if disk['percent'] > self.thresholds['disk_critical']:
-                usage_color = "red"
-            elif disk['percent'] > self.thresholds['disk_warning']:
-                usage_color = "yellow"
-            
             usage_bar = self._create_progress_bar(disk['percent'], width=15)
             table.add_row(
                 disk['device'][:10],  # Truncate long device names
@@ -852,10 +1349,8 @@ class SystemMonitor:
             )
         
         # Add disk I/O information
-        current_io = self._get_disk_io_counters()
-        if current_io != (0, 0) and self.prev_disk_counters != (0, 0):
-            read_speed = (current_io[0] - self.prev_disk_counters[0]) / self.update_interval
-            write_speed = (current_io[1] - self.prev_disk_counters[1]) / self.update_interval
+        if disk_io:
+            read_speed, write_speed = disk_io
             
             if read_speed > 0 or write_speed > 0:
                 table.add_row(
@@ -865,19 +1360,11 @@ class SystemMonitor:
                     "", "", ""
                 )
         
-        self.prev_disk_counters = current_io
-        
         return Panel(table, title="Disk Usage & I/O", border_style="yellow")
     
-    def _create_network_panel(self):
+    def _create_network_panel(self, net_info, connections, network_history):
         """Create network information panel with enhanced monitoring"""
-        net_info = self._get_network_info()
-        connections = self._get_network_connections()
-        
-        table = Table(show_header=False, box=None, padding=(0, 1))
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value")
-        table.add_column("Visual")
+        table = self._new_table('network')
         
         # Current speeds
         table.add_row(
@@ -904,10 +1391,9 @@ class SystemMonitor:
         )
         
         # Active interfaces
-        active_interfaces = [iface for iface in net_info['interfaces'] if iface['is_up']]
         table.add_row(
             "Active Interfaces",
-            f"{len(active_interfaces)} up",
+            f"{net_info['interfaces_up']} up",
             ""
         )
         
@@ -920,20 +1406,16 @@ class SystemMonitor:
             )
         
         # Network history
-        total_speed = net_info['download_speed'] + net_info['upload_speed']
-        self.network_history.append(total_speed / 1024)  # Convert to KB/s
         table.add_row(
             "Activity",
-            self._create_sparkline(list(self.network_history), width=30),
+            self._create_sparkline(network_history, width=30),
             ""
         )
         
         return Panel(table, title="Network Information", border_style="blue")
     
-    def _create_gpu_panel(self):
+    def _create_gpu_panel(self, gpu_info):
         """Create GPU information panel"""
-        gpu_info = self._get_gpu_info()
-        
         if not gpu_info:
             return Panel(
                 Align.center("No GPU detected or GPUtil not available"),
@@ -941,26 +1423,20 @@ class SystemMonitor:
                 border_style="dim"
             )
         
-        table = Table(show_header=True, box=box.ROUNDED)
-        table.add_column("GPU", style="cyan")
-        table.add_column("Load")
-        table.add_column("Memory")
-        table.add_column("Temperature")
+        table = self._new_table('gpu')
         
         for gpu in gpu_info:
             table.add_row(
                 gpu['name'][:20],  # Truncate long GPU names
-                self._create_progress_bar(gpu['load'], width=10),
-                f"{gpu['memory_used']}MB / {gpu['memory_total']}MB",
-                f"{gpu['temperature']}°C"
+                self._create_progress_bar(gpu['load'], width=10) if gpu['load'] is not None else "N/A",
+                f"{gpu['memory_used']}MB / {gpu['memory_total']}MB" if gpu['memory_used'] is not None else "N/A",
+                f"{gpu['temperature']}°C" if gpu['temperature'] is not None else "N/A"
             )
         
         return Panel(table, title="GPU Information", border_style="magenta")
     
-    def _create_battery_panel(self):
+    def _create_battery_panel(self, battery_info):
         """Create battery information panel"""
-        battery_info = self._get_battery_info()
-        
         if not battery_info:
             return Panel(
                 Align.center("No battery detected"),
@@ -968,21 +1444,12 @@ class SystemMonitor:
                 border_style="dim"
             )
         
-        table = Table(show_header=False, box=None, padding=(0, 1))
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value")
-        table.add_column("Visual")
+        table = self._new_table('battery')
         
         status = "🔌 Charging" if battery_info['plugged'] else "🔋 Discharging"
         table.add_row("Status", status, "")
         
-        # Battery level with color coding
-        battery_color = "green"
-        if battery_info['percent'] < 20:
-            battery_color = "red"
-        elif battery_info['percent'] < 50:
-            battery_color = "yellow"
-        
+        # Battery level
         table.add_row(
             "Charge",
             f"{battery_info['percent']:.1f}%",
@@ -995,35 +1462,25 @@ class SystemMonitor:
         
         return Panel(table, title="Battery", border_style="cyan")
     
-    def _create_processes_panel(self):
+    def _create_processes_panel(self, processes):
         """Create top processes panel with enhanced information"""
-        processes = self._get_top_processes(limit=15)
-        
-        table = Table(show_header=True, box=box.ROUNDED)
-        table.add_column("PID", justify="right", style="dim")
-        table.add_column("Name", style="cyan")
-        table.add_column("CPU%", justify="right")
-        table.add_column("Mem%", justify="right")
-        table.add_column("Memory", justify="right")
+        table = self._new_table('processes')
         
         for i, proc in enumerate(processes):
-            memory_info = proc.get('memory_info')
-            memory_mb = 0
-            if memory_info and hasattr(memory_info, 'rss'):
-                memory_mb = memory_info.rss / (1024 * 1024)
-            elif isinstance(memory_info, dict) and 'rss' in memory_info:
-                memory_mb = memory_info['rss'] / (1024 * 1024)
+            memory_mb = proc['rss'] / (1024 * 1024)
             
             # Highlight high resource usage
-            cpu_style = "red" if proc['cpu_percent'] > 50 else "yellow" if proc['cpu_percent'] > 25 else "white"
-            mem_style = "red" if proc['memory_percent'] > 10 else "yellow" if proc['memory_percent'] > 5 else "white"
+            cpu_style = _PROCESS_STYLES[(proc['cpu_percent'] > 25) + (proc['cpu_percent'] > 50)]
+            mem_style = _PROCESS_STYLES[(proc['memory_percent'] > 5) + (proc['memory_percent'] > 10)]
             
+            # Plain Text cells skip markup parsing, and keep process names
+            # containing brackets from being read as style tags
             table.add_row(
-                str(proc['pid']),
-                proc['name'][:20],
-                Text(f"{proc['cpu_percent']:.1f}", style=cpu_style),
-                Text(f"{proc['memory_percent']:.1f}", style=mem_style),
-                f"{memory_mb:.0f}MB"
+                styled_text(str(proc['pid'])),
+                styled_text(proc['name'][:20]),
+                styled_text(f"{proc['cpu_percent']:.1f}", cpu_style),
+                styled_text(f"{proc['memory_percent']:.1f}", mem_style),
+                styled_text(f"{memory_mb:.0f}MB")
             )
         
         # Add sort indicator
@@ -1031,10 +1488,8 @@ class SystemMonitor:
         
         return Panel(table, title=f"Top Processes - {sort_indicator}", border_style="white")
     
-    def _create_docker_panel(self):
+    def _create_docker_panel(self, docker_info):
         """Create Docker containers panel"""
-        docker_info = self._get_docker_info()
-        
         if not docker_info:
             return Panel(
                 Align.center("Docker not available or no containers"),
@@ -1042,29 +1497,28 @@ class SystemMonitor:
                 border_style="dim"
             )
         
-        table = Table(show_header=True, box=box.ROUNDED)
-        table.add_column("Container", style="cyan")
-        table.add_column("Image")
-        table.add_column("Status")
-        table.add_column("Ports")
+        # Containers are polled every few seconds but rarely change
+        signature = tuple((c['name'], c['image'], c['status'], c['ports_str']) for c in docker_info[:10])
+        panel = self._cached_panel('docker', signature)
+        if panel is not None:
+            return panel
+        
+        table = self._new_table('docker')
         
         for container in docker_info[:10]:  # Show up to 10 containers
             status_color = "green" if container['status'] == 'running' else "red"
-            ports_str = ", ".join([f"{k}:{v}" for k, v in container['ports'].items()]) if container['ports'] else "None"
             
             table.add_row(
                 container['name'][:15],
                 container['image'][:25],
-                Text(container['status'], style=status_color),
-                ports_str[:20]
+                styled_text(container['status'], status_color),
+                container['ports_str']
             )
         
-        return Panel(table, title="Docker Containers", border_style="blue")
+        return self._cache_panel('docker', signature, Panel(table, title="Docker Containers", border_style="blue"))
     
-    def _create_services_panel(self):
+    def _create_services_panel(self, services):
         """Create system services panel"""
-        services = self._get_system_services()
-        
         if not services:
             return Panel(
                 Align.center("No services information available"),
@@ -1072,21 +1526,23 @@ class SystemMonitor:
                 border_style="dim"
             )
         
-        table = Table(show_header=True, box=box.ROUNDED)
-        table.add_column("Service", style="cyan")
-        table.add_column("Status")
-        table.add_column("Description")
+        signature = tuple((s['name'], s['status'], s['description']) for s in services[:15])
+        panel = self._cached_panel('services', signature)
+        if panel is not None:
+            return panel
+        
+        table = self._new_table('services')
         
         for service in services[:15]:  # Show up to 15 services
             status_color = "green" if service['status'] == 'active' else "yellow"
             
             table.add_row(
                 service['name'][:20],
-                Text(service['status'], style=status_color),
+                styled_text(service['status'], status_color),
                 service['description'][:40]
             )
         
-        return Panel(table, title="System Services", border_style="green")
+        return self._cache_panel('services', signature, Panel(table, title="System Services", border_style="green"))
     
     def _create_alerts_panel(self):
         """Create alerts panel"""
@@ -1097,61 +1553,45 @@ class SystemMonitor:
                 border_style="green"
             )
         
-        table = Table(show_header=True, box=box.ROUNDED)
-        table.add_column("Time", style="dim")
-        table.add_column("Level")
-        table.add_column("Message", style="cyan")
+        # Rebuilt only when an alert is added or drops out
+        signature = tuple((a['time'], a['level'], a['message']) for a in self.alerts)
+        panel = self._cached_panel('alerts', signature)
+        if panel is not None:
+            return panel
+        
+        table = self._new_table('alerts')
         
-        for alert in self.alerts[-10:]:  # Show last 10 alerts
+        for alert in self.alerts:  # Show last 10 alerts
             level_color = "red" if alert['level'] == 'critical' else "yellow"
-            time_str = alert['time'].strftime("%H:%M:%S")
             
             table.add_row(
-                time_str,
-                Text(alert['level'].upper(), style=level_color),
+                alert['time_str'],
+                styled_text(alert['level'].upper(), level_color),
                 alert['message'][:50]
             )
         
-        border_color = "red" if any(a['level'] == 'critical' for a in self.alerts[-3:]) else "yellow"
-        return Panel(table, title="System Alerts", border_style=border_color)
+        border_color = "red" if self._has_recent_critical() else "yellow"
+        return self._cache_panel('alerts', signature, Panel(table, title="System Alerts", border_style=border_color))
     
     def _create_help_panel(self):
         """Create help panel with keyboard shortcuts"""
-        help_text = """
-[bold cyan]Keyboard Shortcuts:[/bold cyan]
-
-[yellow]q[/yellow] - Quit application
-[yellow]h[/yellow] - Toggle this help
-[yellow]1[/yellow] - Main dashboard view
-[yellow]2[/yellow] - Docker containers view  
-[yellow]3[/yellow] - System alerts view
-
-[yellow]c[/yellow] - Sort processes by CPU
-[yellow]m[/yellow] - Sort processes by Memory
-[yellow]p[/yellow] - Sort processes by PID
-[yellow]n[/yellow] - Sort processes by Name
-
-[yellow]s[/yellow] - Toggle system info panel
-[yellow]u[/yellow] - Toggle CPU panel
-[yellow]r[/yellow] - Toggle memory panel
-[yellow]d[/yellow] - Toggle disk panel
-[yellow]t[/yellow] - Toggle network panel
-[yellow]g[/yellow] - Toggle GPU panel
-[yellow]b[/yellow] - Toggle battery panel
-
-[yellow]+[/yellow] - Increase update interval
-[yellow]-[/yellow] - Decrease update interval
-
-[bold green]Current Configuration:[/bold green]
-Update Interval: {self.update_interval:.1f}s
-Process Sort: {self.process_sort_key.replace('_', ' ').title()}
-        """
+        # Only the configuration lines vary, so the panel is rebuilt only
+        # when one of them changes
+        signature = (self.update_interval, self.process_sort_key)
+        panel = self._cached_panel('help', signature)
+        if panel is not None:
+            return panel
+        
+        help_text = _HELP_TEXT.format(
+            interval=self.update_interval,
+            sort_key=self.process_sort_key.replace('_', ' ').title()
+        )
         
-        return Panel(
+        return self._cache_panel('help', signature, Panel(
             Align.center(help_text),
             title="Help & Controls",
             border_style="cyan"
-        )
+        ))
 
 def main():
     """Main entry point"""